@@ -245,10 +245,7 @@ class SignalsMeanDistance(BaseDistance):
         if xs_is_present[3] == 1 and ys_is_present[3] == 1:
             x_positions: np.ndarray = np.array([x[signal_identifiers[3]] for x in xs])
             y_positions: np.ndarray = np.array([y[signal_identifiers[3]] for y in ys])
-            tmp: np.ndarray = np.zeros((len(x_positions), len(y_positions)))
-            for x_ix, x_value in enumerate(x_positions):
-                for y_ix, y_value in enumerate(y_positions):
-                    tmp[x_ix, y_ix] = np.abs(x_value - y_value)
+            tmp: np.ndarray = np.abs(x_positions[:, np.newaxis] - y_positions[np.newaxis, :])
             distances = np.add(distances, tmp)
 
         if xs_is_present[4] == 1 and ys_is_present[4] == 1:
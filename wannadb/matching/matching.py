@@ -396,7 +396,7 @@ class RankingBasedMatcher(BaseMatcher):
                     if len(additional_nuggets) > 0:
                         logger.info(f"Found {len(additional_nuggets)} additional nuggets.")
                         # convert nugget description into InformationNugget
-                        additional_nuggets = list(map(lambda i: InformationNugget(*i), additional_nuggets))
+                        additional_nuggets = [InformationNugget(*i) for i in additional_nuggets]
                         for additional_nugget in additional_nuggets:
                             additional_nugget[LabelSignal] = attribute.name
                             additional_nugget[ExtractorNameSignal] = str(self._find_additional_nuggets)
@@ -256,7 +256,7 @@ class FigerNERExtractor(BaseExtractor):
 
                     document[SentenceStartCharsSignal] = SentenceStartCharsSignal(sentence_start_chars)
                 else:
-                    print(logger.warning(f"Failed to run FIGER on document '{document.name}' with error '{answer['error']}'"))
+                    logger.warning(f"Failed to run FIGER on document '{document.name}' with error '{answer['error']}'")
             else:
                 logger.warning(f"Failed to run FIGER on document '{document.name}'")
 
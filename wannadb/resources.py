@@ -543,16 +543,11 @@ class GloveEmbeddings300(BaseResource):
             self._index2word: List = [line.rstrip("\n") for line in file]
         vectors_memmap: np.memmap = np.memmap(vector_path, dtype="float32", mode="r")
         self._vectors_memmap = vectors_memmap.reshape(-1, 300)
-        embedding_vector = {}
         assert (len(self._index2word) == len(self._vectors_memmap))
-        for i, w in enumerate(self._index2word):
-            embedding_vector[w] = vectors_memmap[i]
-
-        print(f"Loaded {len(embedding_vector)} word vectors.")
 
         self._word2index: Dict = dict(map(reversed, enumerate(self._index2word)))
 
-        print("Done loading embeddings.")
+        logger.info(f"Loaded {len(self._word2index)} word vectors.")
 
     @classmethod
     def load(cls) -> "GloveEmbeddings300":
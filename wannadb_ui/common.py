@@ -129,6 +129,8 @@ class CustomScrollableList(QWidget):
         return self.item_widgets[self.num_visible_item_widgets - 1]
 
     def update_item_list(self, item_list, params=None):
+        # suspend repaints while the item widgets are shown, hidden, and updated
+        self.list_widget.setUpdatesEnabled(False)
 
         if self.floating_widget is not None:
             self.list_layout.removeWidget(self.floating_widget)
@@ -157,6 +159,8 @@ class CustomScrollableList(QWidget):
         for item, item_widget in zip(item_list, self.item_widgets[:len(item_list)]):
             item_widget.update_item(item, params)
 
+        self.list_widget.setUpdatesEnabled(True)
+
     def enable_input(self):
         for item_widget in self.item_widgets:
             item_widget.enable_input()
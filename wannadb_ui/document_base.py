@@ -142,6 +142,7 @@ class DocumentBaseViewerWidget(MainWindowContent):
             results = self.main_window.cache_db.execute_queries(rewritten_query)[0]
 
             # update results
+            self.results_table.setUpdatesEnabled(False)
             self.results_table.setRowCount(len(results))
             attribute_count = len(attribute_names)
             self.results_table.setColumnCount(attribute_count)
@@ -156,6 +157,7 @@ class DocumentBaseViewerWidget(MainWindowContent):
                         self.results_table.setItem(index, c, QTableWidgetItem(""))
 
             self.results_table.resizeColumnsToContents()
+            self.results_table.setUpdatesEnabled(True)
 
     def enable_input(self):
         self.enter_query_button.setEnabled(True)
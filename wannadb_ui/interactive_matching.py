@@ -13,6 +13,17 @@ logger = logging.getLogger(__name__)
 
 ICON_HIGH_CONFIDENCE = QIcon("wannadb_ui/resources/confidence_high.svg")
 ICON_LOW_CONFIDENCE = QIcon("wannadb_ui/resources/confidence_low.svg")
+ICON_RUN = QIcon("wannadb_ui/resources/run.svg")
+ICON_CORRECT = QIcon("wannadb_ui/resources/correct.svg")
+ICON_PENCIL = QIcon("wannadb_ui/resources/pencil.svg")
+
+SANITIZE_TABLE = str.maketrans({"\n": " "})
+
+NUGGET_LIST_WAIT_DESCRIPTION = "Please wait while WannaDB prepares the interactive table population."
+NUGGET_LIST_DESCRIPTION = (
+    "Please confirm or edit the cell value guesses displayed below until you are satisfied with the guessed values, at which point you may continue with the next attribute."
+    "\nWannaDB will use your feedback to continuously update its guesses. Note that the cells with low confidence (low confidence bar, light yellow highlights) will be left empty."
+)
 
 
 class InteractiveMatchingWidget(MainWindowContent):
@@ -21,7 +32,7 @@ class InteractiveMatchingWidget(MainWindowContent):
 
         self.stop_button = QPushButton("Continue With Next Attribute")
         self.stop_button.setFont(BUTTON_FONT)
-        self.stop_button.setIcon(QIcon("wannadb_ui/resources/run.svg"))
+        self.stop_button.setIcon(ICON_RUN)
         self.stop_button.clicked.connect(self._stop_button_clicked)
         self.stop_button.setMaximumWidth(240)
         self.controls_widget_layout.addWidget(self.stop_button)
@@ -79,7 +90,7 @@ class NuggetListWidget(QWidget):
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(10)
 
-        self.description = QLabel("Please wait while WannaDB prepares the interactive table population.")
+        self.description = QLabel(NUGGET_LIST_WAIT_DESCRIPTION)
         self.description.setFont(LABEL_FONT)
         self.layout.addWidget(self.description)
 
@@ -100,8 +111,7 @@ class NuggetListWidget(QWidget):
         self.layout.addWidget(self.nugget_list)
 
     def update_nuggets(self, feedback_request):
-        self.description.setText("Please confirm or edit the cell value guesses displayed below until you are satisfied with the guessed values, at which point you may continue with the next attribute."
-                                 "\nWannaDB will use your feedback to continuously update its guesses. Note that the cells with low confidence (low confidence bar, light yellow highlights) will be left empty.")
+        self.description.setText(NUGGET_LIST_DESCRIPTION)
         nuggets = feedback_request["nuggets"]
         params = {
             "max_start_chars": max([nugget[CachedContextSentenceSignal]["start_char"] for nugget in nuggets]),
@@ -171,13 +181,13 @@ class NuggetListItemWidget(CustomScrollableListItem):
         # self.layout.addWidget(self.right_split_label)
 
         self.match_button = QPushButton()
-        self.match_button.setIcon(QIcon("wannadb_ui/resources/correct.svg"))
+        self.match_button.setIcon(ICON_CORRECT)
         self.match_button.setToolTip("Confirm this value.")
         self.match_button.clicked.connect(self._match_button_clicked)
         self.layout.addWidget(self.match_button)
 
         self.fix_button = QPushButton()
-        self.fix_button.setIcon(QIcon("wannadb_ui/resources/pencil.svg"))
+        self.fix_button.setIcon(ICON_PENCIL)
         self.fix_button.setToolTip("Edit this value.")
         self.fix_button.clicked.connect(self._fix_button_clicked)
         self.layout.addWidget(self.fix_button)
@@ -188,9 +198,10 @@ class NuggetListItemWidget(CustomScrollableListItem):
         max_start_chars = params["max_start_chars"]
         max_distance = params["max_distance"]
 
-        sentence = self.nugget[CachedContextSentenceSignal]["text"]
-        start_char = self.nugget[CachedContextSentenceSignal]["start_char"]
-        end_char = self.nugget[CachedContextSentenceSignal]["end_char"]
+        context_sentence = self.nugget[CachedContextSentenceSignal]
+        sentence = context_sentence["text"]
+        start_char = context_sentence["start_char"]
+        end_char = context_sentence["end_char"]
 
         if max_distance < self.nugget[CachedDistanceSignal]:
             color = LIGHT_YELLOW
@@ -379,8 +390,7 @@ class DocumentWidget(QWidget):
                 self._highlight_current_nugget()
 
             # update custom selection widget with span
-            sanitized_text = self.document.text[start: end]
-            sanitized_text = sanitized_text.replace("\n", " ")
+            sanitized_text = self.document.text[start: end].translate(SANITIZE_TABLE)
             self.custom_selection_item_widget.text_label.setText(sanitized_text)
             self.custom_selection_item_widget.show()
             self.suggestion_list.scroll_area.horizontalScrollBar().setValue(
@@ -421,14 +431,18 @@ class DocumentWidget(QWidget):
 
         if len(self.nuggets_in_order) > 0:
             self.idx_mapper = {}
-            self.base_formatted_text = ""
+            # collect the formatted text in parts and track its length instead of growing the string per char
+            formatted_parts = []
+            formatted_len = 0
 
             next_unseen_nugget_idx = 0
             inside = False
             current_inside_nuggets = []
+            span_start = f"<span style='background-color: {LIGHT_YELLOW}'><b>"
+            span_end = "</span></b>"
 
             # For every char in the original document
-            for idx, char in enumerate(list(self.document.text)):
+            for idx, char in enumerate(self.document.text):
                 if char == "\n":
                     char = "<br>"
                 # Get all nuggets starting here (unseen and start char is not greater than current index)
@@ -442,8 +456,9 @@ class DocumentWidget(QWidget):
                 # Are we outside?
                 if len(current_inside_nuggets) == 0:
                     # Just write out the char and map index to len - 1
-                    self.base_formatted_text += char
-                    self.idx_mapper[idx] = len(self.base_formatted_text) - 1
+                    formatted_parts.append(char)
+                    formatted_len += len(char)
+                    self.idx_mapper[idx] = formatted_len - 1
                 # Are we inside?
                 else:
                     # Determine if there are any nuggets ending here and remove them from the list of active nuggets
@@ -455,17 +470,22 @@ class DocumentWidget(QWidget):
                     # Did we switch from outside to inside?
                     if not inside:
                         inside = True
-                        self.base_formatted_text += f"<span style='background-color: {LIGHT_YELLOW}'><b>"
-                        self.base_formatted_text += char
-                        self.idx_mapper[idx] = len(self.base_formatted_text) - 1
+                        formatted_parts.append(span_start)
+                        formatted_parts.append(char)
+                        formatted_len += len(span_start) + len(char)
+                        self.idx_mapper[idx] = formatted_len - 1
                     # Inside
                     else:
                         # But now the questions: really inside or at the end?
                         if len(current_inside_nuggets) == 0:
-                            self.base_formatted_text += "</span></b>"
+                            formatted_parts.append(span_end)
+                            formatted_len += len(span_end)
                             inside = False
-                        self.base_formatted_text += char
-                        self.idx_mapper[idx] = len(self.base_formatted_text) - 1
+                        formatted_parts.append(char)
+                        formatted_len += len(char)
+                        self.idx_mapper[idx] = formatted_len - 1
+
+            self.base_formatted_text = "".join(formatted_parts)
         else:
             self.idx_mapper = {}
             for idx in range(len(self.document.text)):
@@ -514,8 +534,7 @@ class SuggestionListItemWidget(CustomScrollableListItem):
 
     def update_item(self, item, params=None):
         self.nugget = item
-        sanitized_text = self.nugget.text
-        sanitized_text = sanitized_text.replace("\n", " ")
+        sanitized_text = self.nugget.text.translate(SANITIZE_TABLE)
         self.text_label.setText(sanitized_text)
         if self.nugget == params:
             self.setStyleSheet(f"background-color: {YELLOW}")